@@ -0,0 +1,25 @@
+"""Launcher for the test scripts with UTF-8 mode enabled.
+
+Setting PYTHONUTF8 inside an already-running interpreter has no effect
+on its I/O encoding, and sys.stdout.reconfigure swaps in a slower
+Python-level codec wrapper. Re-exec the interpreter with the variable
+set before startup instead, so the default fast stdout path stays in
+place.
+
+Usage: python run_tests.py test_full.py [--limit N]
+"""
+import os
+import sys
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("usage: python run_tests.py <test_script.py> [args...]")
+        sys.exit(2)
+
+    env = dict(os.environ, PYTHONUTF8="1")
+    os.execvpe(sys.executable, [sys.executable, *sys.argv[1:]], env)
+
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,10 @@ class Settings(BaseSettings):
 
     # Google Trends
     geos: str = Field(default="US,GB,ID", description="Comma-separated geo codes")
+    max_parallel_fetches: int = Field(
+        default=2,
+        description="Maximum fetches running concurrently (size of the browser context pool)",
+    )
     category_id: int = Field(default=6, description="Google Trends category ID (6=Games)")
     hours: int = Field(default=24, description="Time window in hours")
 
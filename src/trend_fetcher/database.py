@@ -3,25 +3,75 @@
 import aiosqlite
 import asyncio
 import os
-from datetime import datetime, timedelta
+import zstandard as zstd
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional, List
 import json
 import logging
 
 from .config import settings
-from .models import TrendItem, TrendEvent, DedupeKey
+from .models import TrendItem, TrendEvent, DedupeKey, TrendStatus
 
 logger = logging.getLogger(__name__)
 
 
+def utc_now_iso() -> str:
+    """Current UTC time as a compact ISO string (seconds resolution).
+
+    Shorter strings mean smaller index keys; callers writing a batch
+    should compute this once and pass it to every row.
+    """
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+# raw_payload is stored zstd-compressed (typically 4-8x smaller for the
+# Trends JSON), keeping more pages hot in SQLite's cache
+_ZSTD_COMPRESSOR = zstd.ZstdCompressor(level=3)
+_ZSTD_DECOMPRESSOR = zstd.ZstdDecompressor()
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def _compress_payload(raw_payload: str) -> bytes:
+    """Compress a raw payload string for storage."""
+    if not raw_payload:
+        return b""
+    return _ZSTD_COMPRESSOR.compress(raw_payload.encode("utf-8"))
+
+
+# SQL statements used by the batching writer
+_INSERT_EVENT_SQL = """
+    INSERT INTO trends_events
+    (geo, title, normalized_title, rank, search_volume, growth_percent,
+     started_time, status, duration, raw_payload, fetched_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_DEDUPE_SQL = """
+    INSERT OR IGNORE INTO dedupe_keys (geo, date_key, normalized_title, expires_at)
+    VALUES (?, ?, ?, ?)
+"""
+
+
 class Database:
     """Async SQLite database manager."""
 
     def __init__(self, db_path: Optional[str] = None):
         self.db_path = db_path or settings.database_path
         self._connection: Optional[aiosqlite.Connection] = None
-        self._lock = asyncio.Lock()
+        # Writes are serialized by this lock; reads skip it. Everything
+        # shares one connection, so a read can interleave inside the
+        # batch writer's open transaction and observe in-flight rows -
+        # acceptable for the monitoring/stats reads done here.
+        self._write_lock = asyncio.Lock()
+        # Write-batching: pending (kind, params, future) rows committed together
+        # so a burst of N inserts costs one fsync instead of N.
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._max_write_batch = 100
+        # Periodic PASSIVE WAL checkpoint (autocheckpoint is disabled)
+        self._checkpoint_task: Optional[asyncio.Task] = None
+        self._checkpoint_interval = 60.0
 
     async def connect(self) -> None:
         """Initialize database connection and create tables."""
@@ -30,24 +80,131 @@ class Database:
         db_dir.mkdir(parents=True, exist_ok=True)
 
         self._connection = await aiosqlite.connect(self.db_path)
+        # C-level row objects; dict(row) replaces per-query column zipping
+        self._connection.row_factory = aiosqlite.Row
 
         # Enable WAL mode for better concurrency
         await self._connection.execute("PRAGMA journal_mode=WAL")
         await self._connection.execute("PRAGMA synchronous=NORMAL")
 
+        # Keep temp structures and more pages in RAM, mmap the database
+        # file, and wait out transient SQLITE_BUSY instead of failing
+        await self._connection.execute("PRAGMA temp_store=memory")
+        await self._connection.execute("PRAGMA cache_size=-64000")
+        await self._connection.execute("PRAGMA mmap_size=268435456")
+        await self._connection.execute("PRAGMA busy_timeout=5000")
+
+        # Checkpoint on our own schedule instead of letting autocheckpoint
+        # stall an unlucky commit
+        await self._connection.execute("PRAGMA wal_autocheckpoint=0")
+
         await self._create_tables()
+
+        # Start the background writer that coalesces inserts into batches
+        self._write_queue = asyncio.Queue()
+        self._writer_task = asyncio.create_task(self._writer_loop())
+        self._checkpoint_task = asyncio.create_task(self._checkpoint_loop())
+
         logger.info(f"Database connected: {self.db_path}")
 
+    async def _checkpoint_loop(self) -> None:
+        """Move WAL pages into the main database on a fixed interval.
+
+        PASSIVE checkpoints never block writers, so commits stay fast and
+        predictable while the WAL is kept from growing unboundedly.
+        """
+        while True:
+            await asyncio.sleep(self._checkpoint_interval)
+            try:
+                async with self._write_lock:
+                    await self._connection.execute("PRAGMA wal_checkpoint(PASSIVE)")
+            except Exception as e:
+                logger.warning(f"WAL checkpoint failed: {e}")
+
     async def close(self) -> None:
         """Close database connection."""
+        if self._checkpoint_task:
+            self._checkpoint_task.cancel()
+            try:
+                await self._checkpoint_task
+            except asyncio.CancelledError:
+                pass
+            self._checkpoint_task = None
+        if self._writer_task:
+            # Sentinel tells the writer to flush what's queued and exit
+            await self._write_queue.put(None)
+            await self._writer_task
+            self._writer_task = None
+            self._write_queue = None
         if self._connection:
+            # Refresh query planner statistics before shutting down
+            try:
+                await self._connection.execute("PRAGMA optimize")
+            except Exception as e:
+                logger.debug(f"PRAGMA optimize failed: {e}")
             await self._connection.close()
             self._connection = None
             logger.info("Database connection closed")
 
+    async def _writer_loop(self) -> None:
+        """Background task that drains the write queue in batches.
+
+        Each batch is committed inside a single transaction, so the fsync
+        cost per flush window is O(1) instead of O(rows).
+        """
+        while True:
+            item = await self._write_queue.get()
+            if item is None:
+                return
+            batch = [item]
+            while not self._write_queue.empty() and len(batch) < self._max_write_batch:
+                next_item = self._write_queue.get_nowait()
+                if next_item is None:
+                    await self._flush_batch(batch)
+                    return
+                batch.append(next_item)
+            await self._flush_batch(batch)
+
+    async def _flush_batch(self, batch: list) -> None:
+        """Execute a batch of queued writes in one transaction."""
+        async with self._write_lock:
+            results = []
+            try:
+                await self._connection.execute("BEGIN IMMEDIATE")
+                for kind, params, _future in batch:
+                    if kind == "event":
+                        cursor = await self._connection.execute(_INSERT_EVENT_SQL, params)
+                        results.append(cursor.lastrowid)
+                    else:  # dedupe
+                        # INSERT OR IGNORE: rowcount is 1 for a new key,
+                        # 0 for a duplicate - no exception unwinding needed
+                        cursor = await self._connection.execute(_INSERT_DEDUPE_SQL, params)
+                        results.append(cursor.rowcount == 1)
+                await self._connection.commit()
+            except Exception as e:
+                logger.error(f"Batch write failed ({len(batch)} rows): {e}")
+                try:
+                    await self._connection.rollback()
+                except Exception:
+                    pass
+                for _kind, _params, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+
+            for (_kind, _params, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    async def _enqueue_write(self, kind: str, params: tuple):
+        """Queue a write and wait for its batch to commit."""
+        future = asyncio.get_running_loop().create_future()
+        await self._write_queue.put((kind, params, future))
+        return await future
+
     async def _create_tables(self) -> None:
         """Create database tables if they don't exist."""
-        async with self._lock:
+        async with self._write_lock:
             # Trends events table (append-only log)
             await self._connection.execute("""
                 CREATE TABLE IF NOT EXISTS trends_events (
@@ -61,30 +218,50 @@ class Database:
                     started_time TEXT,
                     status TEXT,
                     duration TEXT,
-                    raw_payload TEXT,
+                    raw_payload BLOB,
                     fetched_at TEXT NOT NULL,
                     created_at TEXT DEFAULT CURRENT_TIMESTAMP
                 )
             """)
 
-            # Deduplication keys table
+            # Migrate a legacy dedupe_keys table (rowid + UNIQUE constraint
+            # + duplicate lookup index = three B-trees for the same data)
+            # to the compound-PK WITHOUT ROWID layout below
+            cursor = await self._connection.execute(
+                "SELECT sql FROM sqlite_master WHERE type='table' AND name='dedupe_keys'"
+            )
+            row = await cursor.fetchone()
+            if row and "WITHOUT ROWID" not in row[0]:
+                logger.info("Migrating dedupe_keys to WITHOUT ROWID schema")
+                await self._connection.execute("DROP INDEX IF EXISTS idx_dedupe_lookup")
+                await self._connection.execute("DROP INDEX IF EXISTS idx_dedupe_expires")
+                await self._connection.execute(
+                    "ALTER TABLE dedupe_keys RENAME TO dedupe_keys_legacy"
+                )
+
+            # Deduplication keys table: data lives directly in the PK
+            # B-tree, so inserts touch one tree instead of three
             await self._connection.execute("""
                 CREATE TABLE IF NOT EXISTS dedupe_keys (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
                     geo TEXT NOT NULL,
                     date_key TEXT NOT NULL,
                     normalized_title TEXT NOT NULL,
                     created_at TEXT DEFAULT CURRENT_TIMESTAMP,
                     expires_at TEXT NOT NULL,
-                    UNIQUE(geo, date_key, normalized_title)
-                )
+                    PRIMARY KEY (geo, date_key, normalized_title)
+                ) WITHOUT ROWID
             """)
 
+            if row and "WITHOUT ROWID" not in row[0]:
+                await self._connection.execute("""
+                    INSERT OR IGNORE INTO dedupe_keys
+                    (geo, date_key, normalized_title, created_at, expires_at)
+                    SELECT geo, date_key, normalized_title, created_at, expires_at
+                    FROM dedupe_keys_legacy
+                """)
+                await self._connection.execute("DROP TABLE dedupe_keys_legacy")
+
             # Create indexes
-            await self._connection.execute("""
-                CREATE INDEX IF NOT EXISTS idx_dedupe_lookup 
-                ON dedupe_keys(geo, date_key, normalized_title)
-            """)
             await self._connection.execute("""
                 CREATE INDEX IF NOT EXISTS idx_dedupe_expires 
                 ON dedupe_keys(expires_at)
@@ -97,32 +274,72 @@ class Database:
             await self._connection.commit()
             logger.info("Database tables created/verified")
 
-    async def insert_trend_event(self, trend: TrendItem, raw_payload: str = "") -> int:
-        """Insert a trend event and return the ID."""
-        async with self._lock:
-            cursor = await self._connection.execute(
-                """
-                INSERT INTO trends_events 
-                (geo, title, normalized_title, rank, search_volume, growth_percent, 
-                 started_time, status, duration, raw_payload, fetched_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    trend.geo,
-                    trend.title,
-                    trend.normalized_title,
-                    trend.rank,
-                    trend.search_volume,
-                    trend.growth_percent,
-                    trend.started_time,
-                    trend.status,
-                    trend.duration,
-                    raw_payload,
-                    datetime.now().isoformat(),
-                ),
+    async def insert_trend_event(
+        self, trend: TrendItem, raw_payload: str = "", now_iso: Optional[str] = None
+    ) -> int:
+        """Insert a trend event and return the ID.
+
+        Pass a shared `now_iso` when inserting a batch so all rows carry
+        the same timestamp and the clock is read once.
+        """
+        return await self._enqueue_write(
+            "event",
+            (
+                trend.geo,
+                trend.title,
+                trend.normalized_title,
+                trend.rank,
+                trend.search_volume,
+                trend.growth_percent,
+                trend.started_time,
+                # The status column is TEXT with legacy 'Active'/'Ended'
+                # rows; store the enum's label so reads stay uniform
+                TrendStatus(trend.status).label,
+                trend.duration,
+                _compress_payload(raw_payload),
+                now_iso or utc_now_iso(),
+            ),
+        )
+
+    async def insert_trend_events_bulk(
+        self,
+        trends: List[TrendItem],
+        raw_payloads: Optional[List[str]] = None,
+        now_iso: Optional[str] = None,
+    ) -> int:
+        """Insert a poll's trend events with one executemany and one commit.
+
+        Returns the rowid of the first inserted row (rowids are sequential
+        within a single executemany).
+        """
+        if not trends:
+            return 0
+
+        now_iso = now_iso or utc_now_iso()
+        raw_payloads = raw_payloads or [""] * len(trends)
+        rows = [
+            (
+                trend.geo,
+                trend.title,
+                trend.normalized_title,
+                trend.rank,
+                trend.search_volume,
+                trend.growth_percent,
+                trend.started_time,
+                TrendStatus(trend.status).label,
+                trend.duration,
+                _compress_payload(raw_payload),
+                now_iso,
             )
+            for trend, raw_payload in zip(trends, raw_payloads)
+        ]
+
+        async with self._write_lock:
+            await self._connection.executemany(_INSERT_EVENT_SQL, rows)
+            cursor = await self._connection.execute("SELECT last_insert_rowid()")
+            last_rowid = (await cursor.fetchone())[0]
             await self._connection.commit()
-            return cursor.lastrowid
+            return last_rowid - len(rows) + 1
 
     async def check_and_insert_dedupe(
         self, geo: str, date_key: str, normalized_title: str
@@ -132,79 +349,109 @@ class Database:
         Returns True if this is a NEW trend (not seen before today).
         Returns False if duplicate (already seen today).
         """
-        expires_at = datetime.now() + timedelta(hours=settings.dedupe_ttl_hours)
+        expires_at = datetime.now(timezone.utc) + timedelta(hours=settings.dedupe_ttl_hours)
 
-        async with self._lock:
-            try:
-                await self._connection.execute(
+        is_new = await self._enqueue_write(
+            "dedupe",
+            (geo, date_key, normalized_title, expires_at.isoformat(timespec="seconds")),
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            kind = "New dedupe key" if is_new else "Duplicate trend"
+            logger.debug(f"{kind}: {geo}/{date_key}/{normalized_title[:30]}")
+        return is_new
+
+    async def get_active_dedupe_keys(self) -> List[tuple]:
+        """Get (geo, date_key, normalized_title) for all non-expired dedupe keys."""
+        cursor = await self._connection.execute(
+            "SELECT geo, date_key, normalized_title FROM dedupe_keys WHERE expires_at > ?",
+            (utc_now_iso(),),
+        )
+        return await cursor.fetchall()
+
+    # Rows deleted per cleanup transaction; bounds each transaction's WAL
+    # footprint so one unlucky commit never stalls the event loop
+    _CLEANUP_BATCH_SIZE = 500
+
+    async def cleanup_expired_dedupe_keys(self) -> int:
+        """Remove expired dedupe keys in bounded batches. Returns count of deleted rows."""
+        now = utc_now_iso()
+        deleted = 0
+        while True:
+            async with self._write_lock:
+                cursor = await self._connection.execute(
                     """
-                    INSERT INTO dedupe_keys (geo, date_key, normalized_title, expires_at)
-                    VALUES (?, ?, ?, ?)
+                    DELETE FROM dedupe_keys
+                    WHERE (geo, date_key, normalized_title) IN (
+                        SELECT geo, date_key, normalized_title
+                        FROM dedupe_keys
+                        WHERE expires_at < ?
+                        LIMIT ?
+                    )
                     """,
-                    (geo, date_key, normalized_title, expires_at.isoformat()),
+                    (now, self._CLEANUP_BATCH_SIZE),
                 )
                 await self._connection.commit()
-                logger.debug(f"New dedupe key: {geo}/{date_key}/{normalized_title[:30]}")
-                return True  # New trend
-            except aiosqlite.IntegrityError:
-                # Duplicate - already exists
-                logger.debug(f"Duplicate trend: {geo}/{date_key}/{normalized_title[:30]}")
-                return False
+            deleted += cursor.rowcount
+            if cursor.rowcount < self._CLEANUP_BATCH_SIZE:
+                break
+        if deleted > 0:
+            logger.info(f"Cleaned up {deleted} expired dedupe keys")
+        return deleted
 
-    async def cleanup_expired_dedupe_keys(self) -> int:
-        """Remove expired dedupe keys. Returns count of deleted rows."""
-        async with self._lock:
-            now = datetime.now().isoformat()
-            cursor = await self._connection.execute(
-                "DELETE FROM dedupe_keys WHERE expires_at < ?", (now,)
-            )
-            await self._connection.commit()
-            deleted = cursor.rowcount
-            if deleted > 0:
-                logger.info(f"Cleaned up {deleted} expired dedupe keys")
-            return deleted
+    async def get_raw_payload(self, event_id: int) -> str:
+        """Get the decompressed raw payload for a trend event."""
+        cursor = await self._connection.execute(
+            "SELECT raw_payload FROM trends_events WHERE id = ?", (event_id,)
+        )
+        row = await cursor.fetchone()
+        if row is None or not row[0]:
+            return ""
+        payload = row[0]
+        if isinstance(payload, str):
+            # Legacy rows written before compression
+            return payload
+        if payload.startswith(_ZSTD_MAGIC):
+            return _ZSTD_DECOMPRESSOR.decompress(payload).decode("utf-8")
+        return payload.decode("utf-8")
 
     async def get_recent_trends(self, geo: str, limit: int = 50) -> List[dict]:
         """Get recent trends for a geo."""
-        async with self._lock:
-            cursor = await self._connection.execute(
-                """
-                SELECT * FROM trends_events 
-                WHERE geo = ? 
-                ORDER BY fetched_at DESC 
-                LIMIT ?
-                """,
-                (geo, limit),
-            )
-            rows = await cursor.fetchall()
-            columns = [desc[0] for desc in cursor.description]
-            return [dict(zip(columns, row)) for row in rows]
+        cursor = await self._connection.execute(
+            """
+            SELECT * FROM trends_events 
+            WHERE geo = ? 
+            ORDER BY fetched_at DESC 
+            LIMIT ?
+            """,
+            (geo, limit),
+        )
+        rows = await cursor.fetchall()
+        return [dict(row) for row in rows]
 
     async def get_stats(self) -> dict:
         """Get database statistics."""
-        async with self._lock:
-            stats = {}
+        stats = {}
 
-            # Total events
-            cursor = await self._connection.execute(
-                "SELECT COUNT(*) FROM trends_events"
-            )
-            stats["total_events"] = (await cursor.fetchone())[0]
+        # Total events
+        cursor = await self._connection.execute(
+            "SELECT COUNT(*) FROM trends_events"
+        )
+        stats["total_events"] = (await cursor.fetchone())[0]
 
-            # Active dedupe keys
-            cursor = await self._connection.execute(
-                "SELECT COUNT(*) FROM dedupe_keys WHERE expires_at > ?",
-                (datetime.now().isoformat(),),
-            )
-            stats["active_dedupe_keys"] = (await cursor.fetchone())[0]
+        # Active dedupe keys
+        cursor = await self._connection.execute(
+            "SELECT COUNT(*) FROM dedupe_keys WHERE expires_at > ?",
+            (utc_now_iso(),),
+        )
+        stats["active_dedupe_keys"] = (await cursor.fetchone())[0]
 
-            # Events by geo
-            cursor = await self._connection.execute(
-                "SELECT geo, COUNT(*) FROM trends_events GROUP BY geo"
-            )
-            stats["events_by_geo"] = dict(await cursor.fetchall())
+        # Events by geo
+        cursor = await self._connection.execute(
+            "SELECT geo, COUNT(*) FROM trends_events GROUP BY geo"
+        )
+        stats["events_by_geo"] = dict(await cursor.fetchall())
 
-            return stats
+        return stats
 
 
 # Global database instance
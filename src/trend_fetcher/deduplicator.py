@@ -1,7 +1,10 @@
 """Deduplication logic for trends."""
 
 import logging
+import math
 from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Optional
 from zoneinfo import ZoneInfo
 import re
 
@@ -11,45 +14,112 @@ from .models import TrendItem
 
 logger = logging.getLogger(__name__)
 
+# Relative-time pattern: one alternation covers "3 hours ago",
+# "1 day ago", "30 minutes ago" in a single pass
+_RELATIVE_TIME_RE = re.compile(r'(\d+)\s*(hour|day|minute)s?\s*ago', re.IGNORECASE)
 
-def get_date_key_from_started_time(started_time: str, geo: str) -> str:
+
+class BloomFilter:
+    """
+    In-memory Bloom filter over dedupe keys.
+
+    Sits in front of the database so that duplicate trends (the vast
+    majority on steady-state polls) are rejected without a SQLite
+    round-trip. False positives are possible but rare (default 0.1%);
+    a false positive only means a duplicate-looking trend is skipped.
+    """
+
+    def __init__(self, expected_items: int = 10000, false_positive_rate: float = 0.001):
+        # m = -n*ln(p) / (ln 2)^2, k = (m/n) * ln 2
+        num_bits = math.ceil(
+            -expected_items * math.log(false_positive_rate) / (math.log(2) ** 2)
+        )
+        self.num_bits = num_bits
+        self.num_hashes = max(1, round(num_bits / expected_items * math.log(2)))
+        self._bits = bytearray((num_bits + 7) // 8)
+
+    def _indexes(self, key: bytes):
+        """Yield bit indexes via double hashing of two FNV-1a variants."""
+        h1 = 0x811C9DC5
+        for b in key:
+            h1 = ((h1 ^ b) * 0x01000193) & 0xFFFFFFFF
+        h2 = 0xCBF29CE484222325
+        for b in key:
+            h2 = ((h2 ^ b) * 0x100000001B3) & 0xFFFFFFFFFFFFFFFF
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key: bytes) -> None:
+        """Mark a key as seen."""
+        for idx in self._indexes(key):
+            self._bits[idx >> 3] |= 1 << (idx & 7)
+
+    def __contains__(self, key: bytes) -> bool:
+        return all(self._bits[idx >> 3] & (1 << (idx & 7)) for idx in self._indexes(key))
+
+
+# Bloom filters don't support deletion, so the filter is rebuilt daily;
+# old date buckets simply stop matching because date_key is in the key.
+_bloom = BloomFilter()
+_bloom_date = ""
+
+
+def _bloom_key(geo: str, date_key: str, normalized_title: str) -> bytes:
+    return f"{geo}|{date_key}|{normalized_title}".encode()
+
+
+def _get_bloom() -> BloomFilter:
+    """Get the current Bloom filter, resetting it when the day rolls over."""
+    global _bloom, _bloom_date
+    today = datetime.now(ZoneInfo(settings.timezone)).strftime("%Y-%m-%d")
+    if today != _bloom_date:
+        _bloom = BloomFilter()
+        _bloom_date = today
+    return _bloom
+
+
+async def warm_bloom() -> int:
+    """Pre-populate the Bloom filter from active dedupe keys on startup."""
+    bloom = _get_bloom()
+    keys = await db.get_active_dedupe_keys()
+    for geo, date_key, normalized_title in keys:
+        bloom.add(_bloom_key(geo, date_key, normalized_title))
+    logger.info(f"Bloom filter warmed with {len(keys)} dedupe keys")
+    return len(keys)
+
+
+def get_date_key_from_started_time(
+    started_time: str, geo: str, now: Optional[datetime] = None
+) -> str:
     """
     Extract date_key from the 'started time' string.
-    
+
     Examples:
         "3 hours ago" -> today's date
         "1 day ago" -> yesterday's date
         "2 days ago" -> 2 days ago
-        
+
     Falls back to system timezone (Asia/Jakarta) if geo timezone unknown.
+    Callers processing a batch can pass a shared `now` to avoid a clock
+    read per trend.
     """
-    tz = get_timezone_for_geo(geo)
-    now = datetime.now(tz)
+    if now is None:
+        now = datetime.now(get_timezone_for_geo(geo))
 
     if not started_time:
         return now.strftime("%Y-%m-%d")
 
-    started_lower = started_time.lower()
-
-    # Parse relative time
+    # Parse relative time in a single pass ("minutes ago" is still today)
     hours_ago = 0
     days_ago = 0
 
-    # Match patterns like "3 hours ago", "1 hour ago"
-    hours_match = re.search(r'(\d+)\s*hours?\s*ago', started_lower)
-    if hours_match:
-        hours_ago = int(hours_match.group(1))
-
-    # Match patterns like "1 day ago", "2 days ago"
-    days_match = re.search(r'(\d+)\s*days?\s*ago', started_lower)
-    if days_match:
-        days_ago = int(days_match.group(1))
-
-    # Match patterns like "30 minutes ago"
-    minutes_match = re.search(r'(\d+)\s*minutes?\s*ago', started_lower)
-    if minutes_match:
-        # Minutes ago is still today
-        pass
+    for match in _RELATIVE_TIME_RE.finditer(started_time):
+        value = int(match.group(1))
+        unit = match.group(2).lower()
+        if unit == "hour":
+            hours_ago = value
+        elif unit == "day":
+            days_ago = value
 
     # Calculate the actual datetime
     if days_ago > 0:
@@ -62,8 +132,9 @@ def get_date_key_from_started_time(started_time: str, geo: str) -> str:
     return target_date.strftime("%Y-%m-%d")
 
 
+@lru_cache(maxsize=16)
 def get_timezone_for_geo(geo: str) -> ZoneInfo:
-    """Get timezone for a geo code."""
+    """Get timezone for a geo code (cached - ZoneInfo parses tzdata on build)."""
     geo_timezones = {
         "US": "America/New_York",
         "GB": "Europe/London",
@@ -78,20 +149,31 @@ def get_timezone_for_geo(geo: str) -> ZoneInfo:
         return ZoneInfo(settings.timezone)
 
 
-async def is_new_trend(trend: TrendItem) -> bool:
+async def is_new_trend(trend: TrendItem, now: Optional[datetime] = None) -> bool:
     """
     Check if a trend is new (not seen today for this geo).
-    
-    Uses atomic database insert with unique constraint.
-    Returns True if new, False if duplicate.
+
+    Consults an in-memory Bloom filter first to short-circuit duplicates,
+    then falls back to an atomic database insert with unique constraint.
+    Returns True if new, False if duplicate. Callers processing a batch
+    can pass a shared `now` to avoid per-trend clock reads.
     """
-    date_key = get_date_key_from_started_time(trend.started_time, trend.geo)
+    date_key = get_date_key_from_started_time(trend.started_time, trend.geo, now=now)
+
+    bloom = _get_bloom()
+    key = _bloom_key(trend.geo, date_key, trend.normalized_title)
+    if key in bloom:
+        # Probably seen already - skip the database round-trip
+        return False
 
-    return await db.check_and_insert_dedupe(
+    is_new = await db.check_and_insert_dedupe(
         geo=trend.geo,
         date_key=date_key,
         normalized_title=trend.normalized_title,
     )
+    # Either way the key now exists in the database
+    bloom.add(key)
+    return is_new
 
 
 async def cleanup_expired():
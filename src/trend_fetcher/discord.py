@@ -2,16 +2,82 @@
 
 import httpx
 import asyncio
+import itertools
 import logging
+import orjson
 import re
+import time
 from typing import Optional, List
 from datetime import datetime
 
 from .config import settings
-from .models import TrendItem
+from .http_client import get_client, close_client  # noqa: F401  (close_client re-exported)
+from .models import TrendItem, TrendStatus
 
 logger = logging.getLogger(__name__)
 
+# Webhook bodies are emoji-heavy; orjson serializes and UTF-8-encodes in C,
+# avoiding httpx's stdlib json.dumps + encode per send. The options let
+# orjson render the naive UTC embed timestamp itself (with a Z suffix)
+# instead of a Python-side isoformat() call.
+_JSON_HEADERS = {"content-type": "application/json"}
+_ORJSON_OPTS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+
+class RateLimiter:
+    """Token-bucket limiter: bursts up to `burst` pass immediately,
+    steady state is capped at `rate` per second."""
+
+    def __init__(self, rate: float, burst: int):
+        self._rate = rate
+        self._capacity = float(burst)
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Take one token, sleeping only when the bucket is empty."""
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._last) * self._rate
+            )
+            self._last = now
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+                self._tokens = 0.0
+                self._last = time.monotonic()
+            else:
+                self._tokens -= 1
+
+
+# Bounded fan-out for parallel sends, a token bucket sized to Discord's
+# 5 req/s webhook limit, plus proactive pacing from Discord's per-bucket
+# rate-limit headers (the 429 path stays as fallback)
+_send_semaphore = asyncio.Semaphore(5)
+_rate_limiter = RateLimiter(rate=5.0, burst=5)
+_bucket_reset_at = 0.0
+
+
+def _update_rate_bucket(headers: httpx.Headers) -> None:
+    """Track the webhook rate-limit bucket so we pace before hitting 429."""
+    global _bucket_reset_at
+    try:
+        remaining = int(headers.get("X-RateLimit-Remaining", "1"))
+        if remaining <= 0:
+            reset_after = float(headers.get("X-RateLimit-Reset-After", "1"))
+            _bucket_reset_at = time.monotonic() + reset_after
+    except (TypeError, ValueError):
+        pass
+
+
+async def _wait_for_rate_bucket() -> None:
+    """Sleep until the rate-limit bucket has capacity again."""
+    wait = _bucket_reset_at - time.monotonic()
+    if wait > 0:
+        await asyncio.sleep(wait)
+
+
 # Geo code to country name/flag mapping
 GEO_DISPLAY = {
     "US": ("United States", "🇺🇸"),
@@ -34,23 +100,53 @@ BLOCKED_KEYWORDS = [
     "horoscope", "zodiac", "weather today", "stock price",
 ]
 
+# Single compiled alternation (longest keywords first) so the whole
+# blocklist is matched in one C-level regex pass per title
+_SPAM_RE = re.compile(
+    "|".join(sorted(map(re.escape, BLOCKED_KEYWORDS), key=len, reverse=True)),
+    re.IGNORECASE,
+)
+
+# Aho-Corasick automaton matches the whole keyword set in O(title length)
+# regardless of how long the blocklist grows; the regex stays as fallback
+# when pyahocorasick isn't installed
+try:
+    import ahocorasick
+
+    _SPAM_AUTOMATON = ahocorasick.Automaton()
+    for _kw in BLOCKED_KEYWORDS:
+        _SPAM_AUTOMATON.add_word(_kw, _kw)
+    _SPAM_AUTOMATON.make_automaton()
+except ImportError:
+    _SPAM_AUTOMATON = None
+
 
 def is_spam_trend(title: str) -> bool:
     """Check if a trend title contains blocked keywords."""
-    title_lower = title.lower()
-    for keyword in BLOCKED_KEYWORDS:
-        if keyword in title_lower:
+    if _SPAM_AUTOMATON is not None:
+        for _, keyword in _SPAM_AUTOMATON.iter(title.lower()):
             logger.info(f"Filtered spam trend: '{title}' (matched: {keyword})")
             return True
+        return False
+
+    match = _SPAM_RE.search(title)
+    if match:
+        logger.info(f"Filtered spam trend: '{title}' (matched: {match.group(0).lower()})")
+        return True
     return False
 
 
+# Invariant parts of the embed, built once at import instead of per message
+_FOOTER = {"text": "Google Trends Gaming Alert • De-duplicated per day"}
+_CATEGORY_FIELD = {"name": "🎮 Category", "value": "Games", "inline": True}
+
+
 def format_discord_message(trend: TrendItem) -> dict:
     """Format a trend as a Discord webhook message with embed."""
     country_name, flag = GEO_DISPLAY.get(trend.geo, (trend.geo, "🌍"))
 
     # Determine status emoji and text
-    is_active = trend.status.lower() == "active"
+    is_active = trend.status == TrendStatus.ACTIVE
     status_emoji = "🟢" if is_active else "⚫"
     status_text = "TRENDING" if is_active else "Ended"
 
@@ -66,6 +162,19 @@ def format_discord_message(trend: TrendItem) -> dict:
         f"<@906519204214214666>"
     )
 
+    return {
+        "content": preview_text,  # This shows in notification bar!
+        "embeds": [_build_embed(trend)],
+    }
+
+
+def _build_embed(trend: TrendItem) -> dict:
+    """Build the embed dict for a trend (shared by single and batch sends)."""
+    country_name, flag = GEO_DISPLAY.get(trend.geo, (trend.geo, "🌍"))
+    is_active = trend.status == TrendStatus.ACTIVE
+    status_emoji = "🟢" if is_active else "⚫"
+    status_text = "TRENDING" if is_active else "Ended"
+
     # Build embed description
     description_lines = []
 
@@ -93,7 +202,7 @@ def format_discord_message(trend: TrendItem) -> dict:
     # Google Trends URL
     trends_url = f"https://trends.google.com/trending?geo={trend.geo}&category={settings.category_id}"
 
-    embed = {
+    return {
         "title": f"🔥 {trend.title}",
         "description": description,
         "color": 0xFF6B35 if is_active else 0x6B7280,
@@ -108,24 +217,13 @@ def format_discord_message(trend: TrendItem) -> dict:
                 "value": f"#{trend.rank}",
                 "inline": True,
             },
-            {
-                "name": "🎮 Category",
-                "value": "Games",
-                "inline": True,
-            },
+            _CATEGORY_FIELD,
         ],
-        "footer": {
-            "text": "Google Trends Gaming Alert • De-duplicated per day",
-        },
-        "timestamp": datetime.utcnow().isoformat(),
+        "footer": _FOOTER,
+        "timestamp": datetime.utcnow(),
         "url": trends_url,
     }
 
-    return {
-        "content": preview_text,  # This shows in notification bar!
-        "embeds": [embed],
-    }
-
 
 async def send_discord_notification(
     trend: TrendItem,
@@ -146,51 +244,116 @@ async def send_discord_notification(
     # Check if trend should be filtered
     if is_spam_trend(trend.title):
         return False  # Don't send, but not an error
-    
+
     url = webhook_url or settings.discord_webhook_url
     message = format_discord_message(trend)
 
+    if await _post_with_retries(url, message, max_retries):
+        logger.info(f"Discord notification sent: {trend.title} ({trend.geo})")
+        return True
+
+    logger.error(f"Failed to send Discord notification for: {trend.title}")
+    return False
+
+
+async def _post_with_retries(url: str, message: dict, max_retries: int = 3) -> bool:
+    """POST a webhook message with rate limiting and retries."""
     retry_delay = 1
+    client = get_client()
 
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        for attempt in range(max_retries):
-            try:
-                response = await client.post(url, json=message)
-
-                if response.status_code == 429:
-                    # Rate limited
-                    retry_after = response.json().get("retry_after", retry_delay * 2)
-                    logger.warning(f"Discord rate limited, waiting {retry_after}s")
-                    await asyncio.sleep(retry_after)
-                    continue
-
-                if response.status_code >= 400:
-                    logger.error(
-                        f"Discord webhook error {response.status_code}: {response.text}"
-                    )
-                    if response.status_code < 500:
-                        break  # Don't retry client errors
-                    await asyncio.sleep(retry_delay)
-                    retry_delay *= 2
-                    continue
-
-                logger.info(f"Discord notification sent: {trend.title} ({trend.geo})")
-                return True
-
-            except httpx.TimeoutException:
-                logger.warning(f"Discord timeout (attempt {attempt + 1})")
+    for attempt in range(max_retries):
+        try:
+            async with _send_semaphore:
+                await _rate_limiter.acquire()
+                await _wait_for_rate_bucket()
+                response = await client.post(
+                    url,
+                    content=orjson.dumps(message, option=_ORJSON_OPTS),
+                    headers=_JSON_HEADERS,
+                )
+            _update_rate_bucket(response.headers)
+
+            if response.status_code == 429:
+                # Rate limited - Discord sets Retry-After, so no need to
+                # parse the response body
+                retry_after = float(response.headers.get("Retry-After") or retry_delay * 2)
+                logger.warning(f"Discord rate limited, waiting {retry_after}s")
+                await asyncio.sleep(retry_after)
+                continue
+
+            if response.status_code >= 400:
+                logger.error(
+                    f"Discord webhook error {response.status_code}: {response.text}"
+                )
+                if response.status_code < 500:
+                    break  # Don't retry client errors
                 await asyncio.sleep(retry_delay)
                 retry_delay *= 2
+                continue
 
-            except Exception as e:
-                logger.error(f"Discord notification error: {e}")
-                await asyncio.sleep(retry_delay)
-                retry_delay *= 2
+            return True
+
+        except httpx.TimeoutException:
+            logger.warning(f"Discord timeout (attempt {attempt + 1})")
+            await asyncio.sleep(retry_delay)
+            retry_delay *= 2
+
+        except Exception as e:
+            logger.error(f"Discord notification error: {e}")
+            await asyncio.sleep(retry_delay)
+            retry_delay *= 2
 
-    logger.error(f"Failed to send Discord notification for: {trend.title}")
     return False
 
 
+async def send_discord_batch(
+    trends: List[TrendItem],
+    webhook_url: Optional[str] = None,
+) -> int:
+    """
+    Send trends as multi-embed webhook POSTs, up to 10 embeds each.
+
+    One HTTPS round-trip and one rate-limit token cover ten trends,
+    so large batches cost a fraction of per-trend sends. Spam-filtered
+    trends are dropped first. Returns the number of trends delivered.
+    """
+    items = [t for t in trends if not is_spam_trend(t.title)]
+    if not items:
+        return 0
+
+    url = webhook_url or settings.discord_webhook_url
+    sent = 0
+
+    for chunk in itertools.batched(items, 10):
+        message = {"embeds": [_build_embed(t) for t in chunk]}
+        if await _post_with_retries(url, message):
+            sent += len(chunk)
+            logger.info(f"Discord batch sent: {len(chunk)} trends")
+
+    return sent
+
+
+async def send_discord_notifications_bulk(
+    trends: List[TrendItem],
+    webhook_url: Optional[str] = None,
+) -> int:
+    """
+    Send notifications for a batch of trends in parallel.
+
+    Fan-out is bounded by the shared semaphore and paced by the
+    rate-limit bucket, so N sends take roughly the max latency
+    instead of the sum. Returns the number of successful sends.
+    """
+    if not trends:
+        return 0
+
+    results = await asyncio.gather(
+        *(send_discord_notification(trend, webhook_url=webhook_url) for trend in trends),
+        return_exceptions=True,
+    )
+    return sum(1 for r in results if r is True)
+
+
 async def send_test_notification(webhook_url: Optional[str] = None) -> bool:
     """Send a test notification to verify webhook works."""
     url = webhook_url or settings.discord_webhook_url
@@ -199,10 +362,13 @@ async def send_test_notification(webhook_url: Optional[str] = None) -> bool:
         "content": "🧪 **Test Message**\n\nGoogle Trends Gaming Alert System is online.\n\n✅ Webhook connection verified.",
     }
 
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        try:
-            response = await client.post(url, json=message)
-            return response.status_code < 400
-        except Exception as e:
-            logger.error(f"Test notification failed: {e}")
-            return False
+    try:
+        response = await get_client().post(
+            url,
+            content=orjson.dumps(message, option=_ORJSON_OPTS),
+            headers=_JSON_HEADERS,
+        )
+        return response.status_code < 400
+    except Exception as e:
+        logger.error(f"Test notification failed: {e}")
+        return False
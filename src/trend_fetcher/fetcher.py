@@ -6,15 +6,159 @@ the exact same data that users see on the page.
 
 import asyncio
 import logging
+import os
+import tempfile
+import time
+from contextlib import asynccontextmanager
 from typing import Optional, List, Tuple
 from datetime import datetime
-from playwright.async_api import async_playwright, Browser, Page, Playwright
+
+import orjson
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
 
 from .config import settings
 from .models import TrendItem
+from .parser import normalize_title
 
 logger = logging.getLogger(__name__)
 
+# Opt-in disk cache for dev loops: with TRENDS_CACHE=1 fetched trends
+# are snapshotted per (geo, hour) so repeated test runs skip the browser
+# round-trip entirely. Off by default so production and CI stay live.
+_CACHE_ENABLED = os.environ.get("TRENDS_CACHE") == "1"
+_CACHE_DIR = os.path.join(tempfile.gettempdir(), "trends_cache")
+
+
+def _cache_path(geo: str) -> str:
+    return os.path.join(_CACHE_DIR, f"{geo}-{int(time.time() // 3600)}.json")
+
+
+def _cache_read(geo: str) -> Optional[List[TrendItem]]:
+    """Load cached trends for the current hour, or None on any miss."""
+    try:
+        with open(_cache_path(geo), "rb") as f:
+            return [TrendItem.model_construct(**d) for d in orjson.loads(f.read())]
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+
+def _cache_write(geo: str, trends: List[TrendItem]) -> None:
+    """Snapshot trends for the current hour; failures are non-fatal."""
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        with open(_cache_path(geo), "wb") as f:
+            f.write(orjson.dumps([t.model_dump() for t in trends]))
+    except OSError as e:
+        logger.debug(f"Trend cache write failed for {geo}: {e}")
+
+# Resource patterns blocked in-browser via CDP; unlike page.route
+# handlers these retain no Python-side state and cost no round-trip
+# per intercepted request
+_BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*analytics*", "*gtag*",
+]
+
+# Trend extractor, injected once per context as an init script so V8
+# compiles it once and each poll only ships a tiny evaluate() call
+_EXTRACT_JS = """
+window.__extractTrends = () => {
+    const trends = [];
+    const rows = document.querySelectorAll('table tbody tr');
+
+    rows.forEach((row, index) => {
+        const cells = row.querySelectorAll('td');
+        if (cells.length >= 4) {
+            // Cell 0: checkbox
+            // Cell 1: Title with trend info
+            // Cell 2: Search volume
+            // Cell 3: Started time
+            // Cell 4: Trend breakdown (optional)
+
+            const titleCell = cells[1];
+            const volumeCell = cells[2];
+            const startedCell = cells[3];
+
+            // Extract title
+            const titleText = titleCell.innerText.trim().split('\\n')[0];
+
+            // Extract volume and growth
+            const volumeText = volumeCell.innerText.trim();
+            const volumeParts = volumeText.split('\\n');
+            const searchVolume = volumeParts[0] || '';
+            const growthPercent = volumeParts[1] || '';
+
+            // Extract started time and duration
+            const startedText = startedCell.innerText.trim();
+            const startedParts = startedText.split('\\n');
+            const startedTime = startedParts[0] || '';
+            const duration = startedParts[1] || '';
+
+            // Status packed as int (0=Active, 1=Ended) to match TrendStatus
+            const status = duration.toLowerCase().includes('lasted') ? 1 : 0;
+
+            if (titleText) {
+                trends.push({
+                    title: titleText,
+                    // ASCII fast path; Python redoes NFKC for non-ASCII titles
+                    normalizedTitle: titleText.toLowerCase().replace(/\\s+/g, ' ').trim(),
+                    rank: index + 1,
+                    searchVolume: searchVolume,
+                    growthPercent: growthPercent,
+                    startedTime: startedTime,
+                    duration: duration,
+                    status: status
+                });
+            }
+        }
+    });
+
+    return trends;
+};
+"""
+
+
+class ContextPool:
+    """Bounded pool of browser contexts shared by the per-geo pollers.
+
+    Contexts are created lazily, checked out exclusively for the duration
+    of each fetch, and recycled after a fixed number of checkouts to cap
+    Playwright's per-context memory growth.
+    """
+
+    def __init__(self, browser: Browser, size: int, max_fetches_per_context: int = 50):
+        self._browser = browser
+        self._max_fetches = max_fetches_per_context
+        # Each slot is None (context not yet created) or [context, fetches_served]
+        self._slots: asyncio.Queue = asyncio.Queue()
+        for _ in range(max(1, size)):
+            self._slots.put_nowait(None)
+
+    @asynccontextmanager
+    async def acquire(self):
+        """Check out a context; returns it to the pool when the block exits."""
+        slot = await self._slots.get()
+        try:
+            if slot is not None and slot[1] >= self._max_fetches:
+                logger.info(f"Recycling browser context after {slot[1]} fetches")
+                await slot[0].close()
+                slot = None
+            if slot is None:
+                context = await self._browser.new_context()
+                await context.add_init_script(_EXTRACT_JS)
+                slot = [context, 0]
+            slot[1] += 1
+            yield slot[0]
+        finally:
+            self._slots.put_nowait(slot)
+
+    async def close(self) -> None:
+        """Close all pooled contexts."""
+        while not self._slots.empty():
+            slot = self._slots.get_nowait()
+            if slot is not None:
+                await slot[0].close()
+
 
 class BrowserFetcher:
     """Fetches trends using Playwright headless browser."""
@@ -23,6 +167,17 @@ class BrowserFetcher:
         self._playwright: Optional[Playwright] = None
         self._browser: Optional[Browser] = None
         self._initialized = False
+        self._pool: Optional[ContextPool] = None
+        # Long-lived page per geo; repeated polls just goto() instead of
+        # paying page creation + CDP setup every cycle. A page dies when
+        # the pool recycles its context (every max_fetches_per_context
+        # checkouts) and is recreated on next use.
+        self._pages: dict[str, Page] = {}
+        # Cheap per-geo table signature from the last poll; when the
+        # rendered table hasn't changed we skip extraction and return
+        # the cached trend list
+        self._last_sig: dict[str, str] = {}
+        self._last_trends: dict[str, List[TrendItem]] = {}
 
     async def initialize(self) -> None:
         """Initialize the browser instance (reusable)."""
@@ -43,11 +198,36 @@ class BrowserFetcher:
             ]
         )
         
+        self._pool = ContextPool(self._browser, settings.max_parallel_fetches)
+
         self._initialized = True
         logger.info("Browser initialized successfully")
 
+    async def _get_page(self, geo: str, context: BrowserContext) -> Page:
+        """Get the long-lived page for a geo, creating it on `context` if needed."""
+        page = self._pages.get(geo)
+        if page is not None and not page.is_closed():
+            return page
+
+        page = await context.new_page()
+        # Block unnecessary resources in-browser for speed; set up
+        # once per page instead of per poll
+        cdp = await context.new_cdp_session(page)
+        await cdp.send("Network.enable")
+        await cdp.send("Network.setBlockedURLs", {"urls": _BLOCKED_URL_PATTERNS})
+
+        self._pages[geo] = page
+        return page
+
     async def close(self) -> None:
         """Close browser and cleanup."""
+        for page in self._pages.values():
+            if not page.is_closed():
+                await page.close()
+        self._pages.clear()
+        if self._pool:
+            await self._pool.close()
+            self._pool = None
         if self._browser:
             await self._browser.close()
             self._browser = None
@@ -64,6 +244,12 @@ class BrowserFetcher:
         Returns:
             Tuple of (success, list of TrendItem, error_message)
         """
+        if _CACHE_ENABLED:
+            cached = _cache_read(geo)
+            if cached is not None:
+                logger.info(f"Serving {len(cached)} trends for {geo} from disk cache")
+                return (True, cached, None)
+
         if not self._initialized:
             await self.initialize()
 
@@ -73,32 +259,63 @@ class BrowserFetcher:
         last_error = None
 
         for attempt in range(max_retries):
-            page = None
             try:
                 logger.info(f"Fetching trends for {geo} (attempt {attempt + 1}/{max_retries})")
-                
-                # Create new page context
-                page = await self._browser.new_page()
-                
-                # Block unnecessary resources for speed
-                await page.route("**/*.{png,jpg,jpeg,gif,svg,ico,woff,woff2}", lambda route: route.abort())
-                await page.route("**/analytics*", lambda route: route.abort())
-                await page.route("**/gtag*", lambda route: route.abort())
-                
-                # Navigate to page (use domcontentloaded instead of networkidle)
-                await page.goto(url, wait_until="domcontentloaded", timeout=60000)
-                
-                # Wait for trends table to load (increased timeout)
-                await page.wait_for_selector("table tbody tr", timeout=30000)
-                
-                # Wait a bit for dynamic content to render
-                await asyncio.sleep(2)
-                
-                # Extract trends from the table
-                trends = await self._extract_trends_from_page(page, geo)
-                
+
+                # Hold a pool slot for the whole fetch: this bounds
+                # concurrent fetches at max_parallel_fetches and charges
+                # the context recycle budget once per poll, so contexts
+                # (and the pages on them) are actually rotated
+                async with self._pool.acquire() as context:
+                    page = await self._get_page(geo, context)
+                    try:
+                        # Return as soon as the navigation commits; the selector
+                        # wait below overlaps with DOM parsing
+                        await page.goto(url, wait_until="commit", timeout=30000)
+
+                        # Wait for trends table to load (increased timeout)
+                        await page.wait_for_selector("table tbody tr", timeout=30000)
+
+                        # Wait until the first row actually has rendered cell text
+                        # instead of sleeping a fixed 2s
+                        await page.wait_for_function(
+                            """() => {
+                                const rows = document.querySelectorAll('table tbody tr');
+                                if (rows.length === 0) return false;
+                                const cells = rows[0].querySelectorAll('td');
+                                return cells.length >= 4 && cells[1].innerText.trim().length > 0;
+                            }""",
+                            timeout=10000,
+                        )
+
+                        # Compare a cheap table signature against the last
+                        # poll; unchanged tables (the common case within a
+                        # few minutes) skip extraction entirely
+                        sig = await page.evaluate(
+                            """() => {
+                                const tbody = document.querySelector('table tbody');
+                                return tbody.querySelectorAll('tr').length + '/' + tbody.innerText.length;
+                            }"""
+                        )
+                        if sig == self._last_sig.get(geo):
+                            logger.debug(f"Table unchanged for {geo}, reusing cached trends")
+                            return (True, self._last_trends[geo], None)
+
+                        # Extract trends from the table
+                        trends = await self._extract_trends_from_page(page, geo)
+                        self._last_sig[geo] = sig
+                        self._last_trends[geo] = trends
+                    except Exception:
+                        # Drop a wedged page; the next attempt recreates it
+                        self._pages.pop(geo, None)
+                        if not page.is_closed():
+                            await page.close()
+                        raise
+
                 if trends:
                     logger.info(f"Successfully fetched {len(trends)} trends for {geo}")
+                    if _CACHE_ENABLED:
+                        _cache_write(geo, trends)
                     return (True, trends, None)
                 else:
                     logger.warning(f"No trends found for {geo}")
@@ -110,79 +327,28 @@ class BrowserFetcher:
                 await asyncio.sleep(retry_delay)
                 retry_delay *= 2
 
-            finally:
-                if page:
-                    await page.close()
-
         logger.error(f"Failed to fetch trends for {geo} after {max_retries} attempts: {last_error}")
         return (False, [], last_error)
 
     async def _extract_trends_from_page(self, page: Page, geo: str) -> List[TrendItem]:
         """Extract trend data directly from the page DOM."""
-        
-        # JavaScript to extract all trend data from the table
-        trends_data = await page.evaluate("""
-            () => {
-                const trends = [];
-                const rows = document.querySelectorAll('table tbody tr');
-                
-                rows.forEach((row, index) => {
-                    const cells = row.querySelectorAll('td');
-                    if (cells.length >= 4) {
-                        // Cell 0: checkbox
-                        // Cell 1: Title with trend info
-                        // Cell 2: Search volume
-                        // Cell 3: Started time
-                        // Cell 4: Trend breakdown (optional)
-                        
-                        const titleCell = cells[1];
-                        const volumeCell = cells[2];
-                        const startedCell = cells[3];
-                        
-                        // Extract title
-                        const titleText = titleCell.innerText.trim().split('\\n')[0];
-                        
-                        // Extract volume and growth
-                        const volumeText = volumeCell.innerText.trim();
-                        const volumeParts = volumeText.split('\\n');
-                        const searchVolume = volumeParts[0] || '';
-                        const growthPercent = volumeParts[1] || '';
-                        
-                        // Extract started time and duration
-                        const startedText = startedCell.innerText.trim();
-                        const startedParts = startedText.split('\\n');
-                        const startedTime = startedParts[0] || '';
-                        const duration = startedParts[1] || '';
-                        
-                        // Determine status from duration text
-                        const status = duration.toLowerCase().includes('lasted') ? 'Ended' : 'Active';
-                        
-                        if (titleText) {
-                            trends.push({
-                                title: titleText,
-                                rank: index + 1,
-                                searchVolume: searchVolume,
-                                growthPercent: growthPercent,
-                                startedTime: startedTime,
-                                duration: duration,
-                                status: status
-                            });
-                        }
-                    }
-                });
-                
-                return trends;
-            }
-        """)
-        
-        # Convert to TrendItem objects
-        items = []
-        for data in trends_data:
-            from .parser import normalize_title
-            
-            item = TrendItem(
+
+        # The extractor was injected per-context as an init script
+        trends_data = await page.evaluate("() => window.__extractTrends()")
+
+        # Convert to TrendItem objects. The data comes from our own
+        # in-page extractor, so skip Pydantic validation via
+        # model_construct - 5-20x cheaper per item.
+        return [
+            TrendItem.model_construct(
                 title=data["title"],
-                normalized_title=normalize_title(data["title"]),
+                # The in-page normalization covers ASCII titles; non-ASCII
+                # ones still need Python's NFKC + invisible-char handling
+                normalized_title=(
+                    data["normalizedTitle"]
+                    if data["title"].isascii()
+                    else normalize_title(data["title"])
+                ),
                 rank=data["rank"],
                 search_volume=data["searchVolume"],
                 growth_percent=data["growthPercent"],
@@ -190,10 +356,11 @@ class BrowserFetcher:
                 status=data["status"],
                 duration=data["duration"],
                 geo=geo,
+                related_queries=[],
+                articles=[],
             )
-            items.append(item)
-        
-        return items
+            for data in trends_data
+        ]
 
 
 # Global browser instance for reuse
@@ -1,7 +1,9 @@
 """FastAPI health check server."""
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from datetime import datetime
+from typing import Optional
 import logging
 
 from .config import settings
@@ -9,21 +11,45 @@ from .database import db
 
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Google Trends Gaming Alert", version="1.0.0")
+# orjson serializes responses in C instead of stdlib json.dumps
+app = FastAPI(
+    title="Google Trends Gaming Alert",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
 
 # Track system state
 _start_time = datetime.now()
 _last_poll_times: dict[str, datetime] = {}
 _poll_errors: dict[str, str] = {}
 
+# Poll state formatted for responses, rebuilt only when a poll finishes
+# rather than on every probe hit
+_cached_poll_view: Optional[dict] = None
+
+
+def _poll_view() -> dict:
+    """Return the cached last-polls/errors view, rebuilding if stale."""
+    global _cached_poll_view
+    if _cached_poll_view is None:
+        _cached_poll_view = {
+            "last_polls": {
+                geo: time.isoformat() for geo, time in _last_poll_times.items()
+            },
+            "errors": dict(_poll_errors) if _poll_errors else None,
+        }
+    return _cached_poll_view
+
 
 def update_last_poll(geo: str, success: bool, error: str = None):
     """Update the last poll time for a geo."""
+    global _cached_poll_view
     _last_poll_times[geo] = datetime.now()
     if error:
         _poll_errors[geo] = error
     elif geo in _poll_errors:
         del _poll_errors[geo]
+    _cached_poll_view = None
 
 
 @app.get("/")
@@ -52,14 +78,13 @@ async def healthcheck():
     # Determine overall health
     is_healthy = db_healthy and len(_poll_errors) < len(settings.geo_list)
 
+    poll_view = _poll_view()
     return {
         "status": "healthy" if is_healthy else "unhealthy",
         "uptime_seconds": int(uptime_seconds),
         "database": "connected" if db_healthy else "disconnected",
-        "last_polls": {
-            geo: time.isoformat() for geo, time in _last_poll_times.items()
-        },
-        "errors": _poll_errors if _poll_errors else None,
+        "last_polls": poll_view["last_polls"],
+        "errors": poll_view["errors"],
         "geos_monitored": settings.geo_list,
     }
 
@@ -76,9 +101,7 @@ async def stats():
         "uptime_seconds": int((datetime.now() - _start_time).total_seconds()),
         "geos": settings.geo_list,
         "poll_interval": f"{settings.poll_interval_min}-{settings.poll_interval_max}s",
-        "last_polls": {
-            geo: time.isoformat() for geo, time in _last_poll_times.items()
-        },
+        "last_polls": _poll_view()["last_polls"],
         "database": db_stats,
     }
 
@@ -0,0 +1,37 @@
+"""Shared httpx client singleton.
+
+One process-wide AsyncClient keeps TCP connections and TLS sessions
+alive across callers, so repeated small JSON posts skip the handshake
+cost a fresh client pays every time.
+"""
+
+import logging
+from typing import Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Get or lazily create the shared HTTP client."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=10,
+            ),
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client (call on shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
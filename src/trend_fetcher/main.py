@@ -5,16 +5,17 @@ import logging
 import random
 import signal
 import sys
+from collections import OrderedDict
 from datetime import datetime
 from typing import Optional
 
 import uvicorn
 
 from .config import settings
-from .database import db
+from .database import db, utc_now_iso
 from .fetcher import get_browser_fetcher, close_browser_fetcher
-from .deduplicator import is_new_trend, cleanup_expired
-from .discord import send_discord_notification, send_test_notification
+from .deduplicator import is_new_trend, cleanup_expired, warm_bloom, get_timezone_for_geo
+from .discord import send_discord_notifications_bulk, send_test_notification, close_client
 from .health import app as health_app, update_last_poll
 
 # Configure structured JSON logging
@@ -28,6 +29,21 @@ logger = logging.getLogger(__name__)
 # Shutdown flag
 _shutdown = asyncio.Event()
 
+# Per-geo LRU of normalized titles already processed, since consecutive
+# polls overlap heavily; exact-match short-circuit ahead of the dedupe
+# machinery. Cleared periodically by cleanup_task.
+_seen_titles: dict[str, OrderedDict] = {}
+_SEEN_MAX_PER_GEO = 500
+
+
+def _mark_seen(geo: str, normalized_title: str) -> None:
+    """Remember a processed title, evicting the oldest beyond the cap."""
+    seen = _seen_titles.setdefault(geo, OrderedDict())
+    seen[normalized_title] = None
+    seen.move_to_end(normalized_title)
+    if len(seen) > _SEEN_MAX_PER_GEO:
+        seen.popitem(last=False)
+
 
 async def poll_geo(geo: str) -> None:
     """
@@ -36,7 +52,11 @@ async def poll_geo(geo: str) -> None:
     This runs in a loop until shutdown is signaled.
     """
     logger.info(f"Starting polling for {geo}")
-    
+
+    # Stagger startup so the geo pollers don't hit the shared browser in
+    # lockstep every cycle
+    await asyncio.sleep(random.uniform(0, settings.poll_interval_min))
+
     # Get shared browser fetcher
     fetcher = await get_browser_fetcher()
 
@@ -52,28 +72,40 @@ async def poll_geo(geo: str) -> None:
             total_count = len(trends)
 
             if success:
-                # Process each trend
+                # One clock read shared by the whole batch
+                poll_now = datetime.now(get_timezone_for_geo(geo))
+                poll_now_iso = utc_now_iso()
+
+                # Process each trend, collecting the new ones
+                new_trends = []
+                seen = _seen_titles.get(geo, ())
                 for trend in trends:
                     try:
+                        # Seen in a recent poll - skip the dedupe machinery
+                        if trend.normalized_title in seen:
+                            continue
+
                         # Check if new (atomic dedup)
-                        is_new = await is_new_trend(trend)
+                        is_new = await is_new_trend(trend, now=poll_now)
+                        _mark_seen(geo, trend.normalized_title)
 
                         if is_new:
-                            new_count += 1
                             logger.info(
                                 f"New trend detected: {trend.title} ({geo}) - "
                                 f"Volume: {trend.search_volume}, Started: {trend.started_time}"
                             )
-
-                            # Store in database
-                            await db.insert_trend_event(trend)
-
-                            # Send Discord notification
-                            await send_discord_notification(trend)
+                            new_trends.append(trend)
 
                     except Exception as e:
                         logger.error(f"Error processing trend '{trend.title}': {e}")
 
+                # Store the poll's new trends in one bulk insert
+                await db.insert_trend_events_bulk(new_trends, now_iso=poll_now_iso)
+
+                # Send Discord notifications in parallel (rate-limit aware)
+                new_count = len(new_trends)
+                await send_discord_notifications_bulk(new_trends)
+
                 logger.info(
                     f"Poll completed for {geo}: {total_count} trends, {new_count} new"
                 )
@@ -106,6 +138,9 @@ async def cleanup_task() -> None:
     while not _shutdown.is_set():
         try:
             await cleanup_expired()
+            # Drop the seen-title caches too; the database dedupe still
+            # guards correctness if a title comes around again
+            _seen_titles.clear()
         except Exception as e:
             logger.error(f"Cleanup error: {e}")
 
@@ -132,12 +167,6 @@ async def run_health_server() -> None:
         pass
 
 
-def handle_shutdown(sig, frame):
-    """Signal handler for graceful shutdown."""
-    logger.info(f"Received signal {sig}, initiating shutdown...")
-    _shutdown.set()
-
-
 async def main() -> None:
     """Main entry point."""
     logger.info("=" * 60)
@@ -149,13 +178,18 @@ async def main() -> None:
     logger.info("Using Playwright headless browser for accurate data fetching")
     logger.info("=" * 60)
 
-    # Setup signal handlers
-    signal.signal(signal.SIGINT, handle_shutdown)
-    signal.signal(signal.SIGTERM, handle_shutdown)
+    # Setup signal handlers on the event loop so delivery happens on the
+    # loop thread instead of racing in-flight I/O
+    loop = asyncio.get_running_loop()
+    loop.add_signal_handler(signal.SIGINT, _shutdown.set)
+    loop.add_signal_handler(signal.SIGTERM, _shutdown.set)
 
     # Initialize database
     await db.connect()
 
+    # Warm the dedupe Bloom filter from existing keys
+    await warm_bloom()
+
     # Initialize browser
     fetcher = await get_browser_fetcher()
 
@@ -163,44 +197,50 @@ async def main() -> None:
     logger.info("Sending startup notification to Discord...")
     await send_test_notification()
 
-    # Create tasks
-    tasks = []
-
-    # Health server
-    health_task = asyncio.create_task(run_health_server())
-    tasks.append(health_task)
-
-    # Polling tasks for each geo (sequential polling to reduce browser load)
-    for geo in settings.geo_list:
-        poll_task = asyncio.create_task(poll_geo(geo))
-        tasks.append(poll_task)
-
-    # Cleanup task
-    cleanup = asyncio.create_task(cleanup_task())
-    tasks.append(cleanup)
-
-    logger.info(f"Started {len(tasks)} tasks (health + {len(settings.geo_list)} polls + cleanup)")
-
-    # Wait for shutdown signal
-    await _shutdown.wait()
+    # Structured concurrency: the group owns every task, so a crashed
+    # poller surfaces instead of dying silently, and shutdown needs no
+    # manual cancel/gather dance
+    try:
+        async with asyncio.TaskGroup() as tg:
+            # Health server (cancelled explicitly on shutdown; the
+            # pollers and cleanup exit on their own once _shutdown sets)
+            health_task = tg.create_task(run_health_server())
 
-    logger.info("Shutting down...")
+            # Polling tasks for each geo (sequential polling to reduce browser load)
+            for geo in settings.geo_list:
+                tg.create_task(poll_geo(geo))
 
-    # Cancel all tasks
-    for task in tasks:
-        task.cancel()
+            # Cleanup task
+            tg.create_task(cleanup_task())
 
-    await asyncio.gather(*tasks, return_exceptions=True)
+            logger.info(
+                f"Started {2 + len(settings.geo_list)} tasks "
+                f"(health + {len(settings.geo_list)} polls + cleanup)"
+            )
 
-    # Close browser and database
-    await close_browser_fetcher()
-    await db.close()
+            # Wait for shutdown signal
+            await _shutdown.wait()
+            logger.info("Shutting down...")
+            health_task.cancel()
+    finally:
+        # Close browser, HTTP client and database
+        await close_browser_fetcher()
+        await close_client()
+        await db.close()
 
     logger.info("Shutdown complete")
 
 
 def run():
     """Entry point for running the application."""
+    # uvloop's libuv-based loop cuts event-loop overhead substantially;
+    # fall back to the default loop where it isn't available (Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
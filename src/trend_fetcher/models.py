@@ -3,6 +3,19 @@
 from pydantic import BaseModel, Field
 from typing import Optional, List
 from datetime import datetime
+from enum import IntEnum
+
+
+class TrendStatus(IntEnum):
+    """Trend lifecycle status, packed as an int for cheap storage."""
+
+    ACTIVE = 0
+    ENDED = 1
+
+    @property
+    def label(self) -> str:
+        """Human-readable form for logs and notifications."""
+        return "Active" if self is TrendStatus.ACTIVE else "Ended"
 
 
 class TrendItem(BaseModel):
@@ -14,7 +27,7 @@ class TrendItem(BaseModel):
     search_volume: str = Field(default="", description="Search volume (e.g., '500+', '2K+')")
     growth_percent: str = Field(default="", description="Growth percentage (e.g., '+200%')")
     started_time: str = Field(default="", description="When trend started (e.g., '3 hours ago')")
-    status: str = Field(default="Active", description="Trend status (Active/Ended)")
+    status: int = Field(default=TrendStatus.ACTIVE, description="Trend status (0=Active, 1=Ended)")
     duration: str = Field(default="", description="How long it lasted (e.g., 'Lasted 2 hrs')")
     geo: str = Field(..., description="Geographic region code (US, GB, ID)")
     related_queries: List[str] = Field(default_factory=list, description="Related search queries")
@@ -32,7 +45,7 @@ class TrendEvent(BaseModel):
     search_volume: str
     growth_percent: str
     started_time: str
-    status: str
+    status: str  # stored as the TrendStatus label ('Active'/'Ended')
     duration: str
     raw_payload: str = Field(default="", description="Raw JSON payload for auditing")
     fetched_at: datetime
@@ -1,20 +1,47 @@
 """Parser for Google Trends batchexecute response."""
 
-import json
 import re
 import logging
+import unicodedata
+
+import orjson
 from typing import List, Optional
 from datetime import datetime
 
-from .models import TrendItem
+from .models import TrendItem, TrendStatus
 
 logger = logging.getLogger(__name__)
 
+# Zero-width and invisible characters stripped from titles; a translate
+# table beats a regex for a small fixed character set
+_INVISIBLE_CHARS = dict.fromkeys(
+    list(range(0x200B, 0x2010)) + list(range(0x2028, 0x2030)) + [0xFEFF, 0x00AD],
+    None,
+)
+
+# Candidate JSON-array lines in a batchexecute response; scanning with
+# finditer avoids materializing a second copy of the response via split()
+_JSON_LINE_RE = re.compile(r'^\s*(\[.*\])\s*$', re.MULTILINE)
+
+# Field-classification patterns for _parse_single_trend, compiled once
+_VOLUME_RE = re.compile(r'^\d+[KMB]?\+?$')
+_VOLUME_COMMA_RE = re.compile(r'^[\d,]+\+?$')
+_GROWTH_RE = re.compile(r'^[+↑]\s?\d+%$')
+# Time/duration/status keywords in one case-insensitive scan, avoiding a
+# lowercased temporary string per candidate item
+_KW_RE = re.compile(r'(ago|lasted)|^(active|ended)$', re.IGNORECASE)
+
+# Fallback extraction of the i0OFE data string when the line scan fails
+_I0OFE_FALLBACK_RE = re.compile(
+    r'\["wrb\.fr","i0OFE","(.+?)(?:(?<!\\)"(?:,null)*,"generic")',
+    re.DOTALL,
+)
+
 
 def normalize_title(title: str) -> str:
     """
     Normalize a trend title for deduplication.
-    
+
     Rules:
     - Convert to lowercase
     - Strip leading/trailing whitespace
@@ -24,20 +51,11 @@ def normalize_title(title: str) -> str:
     if not title:
         return ""
 
-    # Remove zero-width and invisible characters
-    title = re.sub(r'[\u200b-\u200f\u2028-\u202f\ufeff\u00ad]', '', title)
-
-    # Normalize unicode (NFKC form)
-    import unicodedata
-    title = unicodedata.normalize('NFKC', title)
-
-    # Lowercase
-    title = title.lower()
+    # NFKC-normalize, drop invisible characters, lowercase
+    title = unicodedata.normalize('NFKC', title).translate(_INVISIBLE_CHARS).lower()
 
-    # Collapse multiple spaces
-    title = ' '.join(title.split())
-
-    return title.strip()
+    # Collapse multiple spaces (also strips the ends)
+    return ' '.join(title.split())
 
 
 def parse_batchexecute_response(raw_response: str, geo: str) -> List[TrendItem]:
@@ -59,24 +77,20 @@ def parse_batchexecute_response(raw_response: str, geo: str) -> List[TrendItem]:
     trends = []
 
     try:
-        # Remove the security prefix )]}' and any leading characters
-        cleaned = raw_response
-        if cleaned.startswith(")]}'"):
-            cleaned = cleaned[4:]
-        cleaned = cleaned.strip()
-
-        # Split into lines/chunks and find the one with i0OFE data
-        # The format is: NUMBER\nJSON_ARRAY\nNUMBER\nJSON_ARRAY...
-        lines = cleaned.split('\n')
-
-        for i, line in enumerate(lines):
-            line = line.strip()
-            if not line or line.isdigit():
+        # Scan for JSON-array lines directly; the )]}' security prefix
+        # and the NUMBER length lines never match the pattern, so no
+        # stripping or split('\n') materialization is needed
+        for match in _JSON_LINE_RE.finditer(raw_response):
+            line = match.group(1)
+
+            # Only the i0OFE chunk matters; a substring check is far
+            # cheaper than JSON-parsing every other line first
+            if "i0OFE" not in line:
                 continue
 
             try:
                 # Try to parse as JSON
-                parsed = json.loads(line)
+                parsed = orjson.loads(line)
 
                 # Look for the i0OFE response
                 # Format: [["wrb.fr","i0OFE","[DATA]",null,null,null,"generic"]]
@@ -91,7 +105,7 @@ def parse_batchexecute_response(raw_response: str, geo: str) -> List[TrendItem]:
                                         logger.info(f"Parsed {len(trends)} trends for {geo}")
                                         return trends
 
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 continue
 
         # If we couldn't find i0OFE in the structured way, try regex
@@ -109,7 +123,7 @@ def _parse_trends_data(data_str: str, geo: str) -> List[TrendItem]:
     trends = []
 
     try:
-        data = json.loads(data_str)
+        data = orjson.loads(data_str)
 
         # The structure is: [null, [[trend1], [trend2], ...]]
         # Or variations like: [null, [[[trend1], [trend2], ...]]]
@@ -142,7 +156,7 @@ def _parse_trends_data(data_str: str, geo: str) -> List[TrendItem]:
                 logger.debug(f"Error parsing trend {idx}: {e}")
                 continue
 
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         logger.error(f"JSON decode error in trends data: {e}")
     except Exception as e:
         logger.error(f"Error parsing trends data: {e}")
@@ -161,7 +175,7 @@ def _parse_single_trend(trend_data: list, geo: str, rank: int) -> Optional[Trend
     search_volume = ""
     growth_percent = ""
     started_time = ""
-    status = "Active"
+    status = TrendStatus.ACTIVE
     duration = ""
     related_queries = []
 
@@ -178,24 +192,24 @@ def _parse_single_trend(trend_data: list, geo: str, rank: int) -> Optional[Trend
     for item in trend_data:
         if isinstance(item, str):
             # Search volume pattern: "500+", "1K+", "2M+"
-            if re.match(r'^\d+[KMB]?\+?$', item) or re.match(r'^[\d,]+\+?$', item):
+            if _VOLUME_RE.match(item) or _VOLUME_COMMA_RE.match(item):
                 if not search_volume:
                     search_volume = item
             # Growth pattern: "+200%", "↑ 200%"
-            elif re.match(r'^[+↑]\s?\d+%$', item) or item.endswith('%'):
+            elif _GROWTH_RE.match(item) or item.endswith('%'):
                 if not growth_percent:
                     growth_percent = item
-            # Time pattern: "X hours ago", "X minutes ago"
-            elif 'ago' in item.lower():
-                if not started_time:
-                    started_time = item
-            # Duration pattern: "Lasted X hrs"
-            elif 'lasted' in item.lower():
-                if not duration:
-                    duration = item
-            # Status
-            elif item.lower() in ('active', 'ended'):
-                status = item.capitalize()
+            # Time ("X hours ago"), duration ("Lasted X hrs") or status
+            elif (m := _KW_RE.search(item)):
+                kw = (m.group(1) or m.group(2)).lower()
+                if kw == 'ago':
+                    if not started_time:
+                        started_time = item
+                elif kw == 'lasted':
+                    if not duration:
+                        duration = item
+                else:
+                    status = TrendStatus.ENDED if kw == 'ended' else TrendStatus.ACTIVE
 
         elif isinstance(item, list):
             # Could be related queries or articles
@@ -222,8 +236,7 @@ def _parse_with_regex(raw_response: str, geo: str) -> List[TrendItem]:
     trends = []
 
     # Try to find the data string for i0OFE
-    pattern = r'\["wrb\.fr","i0OFE","(.+?)(?:(?<!\\)"(?:,null)*,"generic")'
-    match = re.search(pattern, raw_response, re.DOTALL)
+    match = _I0OFE_FALLBACK_RE.search(raw_response)
 
     if match:
         data_str = match.group(1)
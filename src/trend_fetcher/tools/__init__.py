@@ -0,0 +1 @@
+"""Standalone diagnostic entry points (see [project.scripts] in pyproject)."""
@@ -0,0 +1,34 @@
+"""Debug script to examine what the browser fetcher extracts.
+
+Run as ``debug-fetch`` (console script) or ``python -m trend_fetcher.tools.debug_fetch``.
+"""
+import asyncio
+
+from ..fetcher import BrowserFetcher
+
+
+async def debug():
+    print("DEBUG: Fetching trends...")
+
+    fetcher = BrowserFetcher()
+    try:
+        success, trends, error = await fetcher.fetch_trends("ID")
+
+        print(f"Success: {success}")
+        print(f"Trends: {len(trends)}")
+        print(f"Error: {error}")
+        print("\n--- EXTRACTED TRENDS ---")
+        for t in trends:
+            print(repr(t))
+        print("--- END ---")
+    finally:
+        await fetcher.close()
+
+
+def run():
+    """Entry point for the console script."""
+    asyncio.run(debug())
+
+
+if __name__ == "__main__":
+    run()
@@ -1,16 +1,40 @@
-"""Full test - ALL trends from all 3 regions."""
+"""Full test - ALL trends from all 3 regions.
+
+Pass --limit N to cap the trends sent per region for quick smoke runs.
+"""
 import asyncio
 import sys
-import os
+from itertools import islice
 
-os.environ['PYTHONUTF8'] = '1'
 sys.path.insert(0, 'src')
 
 from trend_fetcher.fetcher import BrowserFetcher
-from trend_fetcher.discord import send_discord_notification
+from trend_fetcher.discord import send_discord_batch, close_client
+
+# Faster event loop where available (not on Windows)
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
 
 REGIONS = ["US", "GB", "ID"]
 
+# Optional per-region cap for fast smoke runs
+LIMIT = (
+    int(sys.argv[sys.argv.index("--limit") + 1])
+    if "--limit" in sys.argv
+    else None
+)
+
+async def _prewarm_dns(hosts):
+    """Resolve endpoint hostnames while Chromium is still launching."""
+    loop = asyncio.get_running_loop()
+    await asyncio.gather(
+        *(loop.getaddrinfo(host, 443) for host in hosts),
+        return_exceptions=True,
+    )
+
 async def test_all_trends():
     print("=" * 50)
     print("FULL TEST - ALL TRENDS FROM 3 REGIONS")
@@ -19,35 +43,54 @@ async def test_all_trends():
     fetcher = BrowserFetcher()
     
     try:
+        # Overlap the ~1s Chromium launch with DNS prefetch for the
+        # endpoints the test will hit right afterwards
         print("\nInitializing browser...")
-        await fetcher.initialize()
+        await asyncio.gather(
+            fetcher.initialize(),
+            _prewarm_dns(["trends.google.com", "discord.com"]),
+        )
         print("Browser ready!")
         
         total_trends = 0
         total_sent = 0
-        
-        for geo in REGIONS:
-            print(f"\n--- {geo} ---")
-            success, trends, error = await fetcher.fetch_trends(geo)
-            
+
+        # Fetch all regions concurrently - wall time is the slowest
+        # region instead of the sum of all three
+        print(f"\nFetching {len(REGIONS)} regions in parallel...")
+        results = await asyncio.gather(
+            *(fetcher.fetch_trends(geo) for geo in REGIONS),
+            return_exceptions=True,
+        )
+
+        for geo, result in zip(REGIONS, results):
+            # One write per region instead of a syscall per line
+            lines = [f"\n--- {geo} ---"]
+
+            if isinstance(result, Exception):
+                lines.append(f"FAILED: {result}")
+                print("\n".join(lines))
+                continue
+            success, trends, error = result
+
             if not success:
-                print(f"FAILED: {error}")
+                lines.append(f"FAILED: {error}")
+                print("\n".join(lines))
                 continue
-            
-            print(f"Found {len(trends)} trends")
+
+            lines.append(f"Found {len(trends)} trends")
             total_trends += len(trends)
-            
-            # Send notification for ALL trends
-            for t in trends:
-                print(f"  Sending: {t.title}...")
-                sent = await send_discord_notification(t)
-                if sent:
-                    total_sent += 1
-                # Rate limit protection
-                await asyncio.sleep(0.5)
-            
-            # Delay between regions
-            await asyncio.sleep(2)
+
+            if LIMIT is not None:
+                trends = list(islice(trends, LIMIT))
+
+            # Send ALL trends as multi-embed batches - one POST and one
+            # rate-limit token per 10 trends
+            lines.append(f"  Sending {len(trends)} notifications...")
+            sent = await send_discord_batch(trends)
+            total_sent += sent
+            lines.append(f"  Sent {sent}")
+            print("\n".join(lines))
         
         print("\n" + "=" * 50)
         print(f"DONE: {total_trends} trends, {total_sent} notifications")
@@ -55,6 +98,7 @@ async def test_all_trends():
         
     finally:
         await fetcher.close()
+        await close_client()
 
 if __name__ == "__main__":
     asyncio.run(test_all_trends())
@@ -1,19 +1,27 @@
 """Quick integration test for the trends fetcher."""
 
 import asyncio
+import logging
 import sys
-import os
-
-# Fix Windows console encoding
-if os.name == 'nt':
-    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+from itertools import islice
 
 sys.path.insert(0, 'src')
 
-from trend_fetcher.fetcher import TrendsFetcher
-from trend_fetcher.parser import parse_batchexecute_response
-from trend_fetcher.discord import send_discord_notification
-from trend_fetcher.models import TrendItem
+from trend_fetcher.fetcher import BrowserFetcher
+from trend_fetcher.discord import send_discord_notification, close_client
+from trend_fetcher.models import TrendStatus
+
+# Faster event loop where available (not on Windows)
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+# Deferred %s formatting: the per-trend messages are only built if the
+# level is enabled, unlike eagerly-evaluated print(f"...") calls
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+log = logging.getLogger("integration-test")
 
 
 async def test_fetch_and_notify():
@@ -22,28 +30,29 @@ async def test_fetch_and_notify():
     print("Google Trends Gaming Alert - Integration Test")
     print("=" * 60)
 
-    async with TrendsFetcher() as fetcher:
+    fetcher = BrowserFetcher()
+    try:
         for geo in ["ID", "US"]:
             print(f"\n[*] Testing {geo}...")
 
-            success, raw_response, error = await fetcher.fetch_trends(geo)
+            success, trends, error = await fetcher.fetch_trends(geo)
 
             if not success:
                 print(f"  [X] Fetch failed: {error}")
                 continue
 
-            print(f"  [OK] Fetched {len(raw_response)} bytes")
-
-            # Parse
-            trends = parse_batchexecute_response(raw_response, geo)
-            print(f"  [OK] Parsed {len(trends)} trends")
+            print(f"  [OK] Fetched {len(trends)} trends")
 
-            # Show trends
-            for trend in trends[:5]:
-                print(f"\n  [TREND] {trend.title}")
-                print(f"     Volume: {trend.search_volume} ({trend.growth_percent})")
-                print(f"     Started: {trend.started_time}")
-                print(f"     Status: {trend.status}")
+            # Show trends (islice iterates without copying a sublist)
+            for trend in islice(trends, 5):
+                log.info(
+                    "\n  [TREND] %s\n     Volume: %s (%s)\n     Started: %s\n     Status: %s",
+                    trend.title,
+                    trend.search_volume,
+                    trend.growth_percent,
+                    trend.started_time,
+                    TrendStatus(trend.status).label,
+                )
 
             # Send ONE notification for the first trend
             if trends:
@@ -56,6 +65,9 @@ async def test_fetch_and_notify():
 
             # Only test first geo for notifications
             break
+    finally:
+        await fetcher.close()
+        await close_client()
 
     print("\n" + "=" * 60)
     print("[OK] Integration test complete!")
@@ -1,34 +1,38 @@
 """Minimal test for core functionality."""
 import asyncio
 import sys
-import os
+from itertools import islice
 
-# Fix Windows encoding
-os.environ['PYTHONUTF8'] = '1'
 sys.path.insert(0, 'src')
 
-from trend_fetcher.fetcher import TrendsFetcher
-from trend_fetcher.parser import parse_batchexecute_response
+from trend_fetcher.fetcher import BrowserFetcher
+
+# Faster event loop where available (not on Windows)
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
 
 async def test():
     print("TEST START")
-    
-    async with TrendsFetcher() as fetcher:
-        success, raw, error = await fetcher.fetch_trends("ID")
-        
+
+    fetcher = BrowserFetcher()
+    try:
+        success, trends, error = await fetcher.fetch_trends("ID")
+
         print(f"Fetch success: {success}")
-        print(f"Response length: {len(raw) if raw else 0}")
-        
+        print(f"Trends found: {len(trends)}")
+
         if success:
-            trends = parse_batchexecute_response(raw, "ID")
-            print(f"Trends found: {len(trends)}")
-            
-            for t in trends[:3]:
+            for t in islice(trends, 3):
                 # Use ASCII only output
                 print(f"  - {t.title} | Vol: {t.search_volume} | {t.started_time}")
         else:
             print(f"Error: {error}")
-    
+    finally:
+        await fetcher.close()
+
     print("TEST DONE")
 
 if __name__ == "__main__":